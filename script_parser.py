@@ -1,22 +1,69 @@
 import fitz  # PyMuPDF
 import re
 import json
+import argparse
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 import os
 
+try:
+    import orjson  # Optional: much faster JSON serialization
+except ImportError:
+    orjson = None
+
+
+# Precompiled patterns used while parsing every line of a script
+# Classifies a script line in one match; lastgroup is the line kind
+_LINE_RE = re.compile(
+    r'(?P<scene>\[Scene:(?:\s*(?P<scene_name>.*?)\])?)'
+    r'|(?P<stage>[\[\(])'
+    r'|(?P<speaker>(?P<name>[A-Z][a-z]+):\s*(?P<say>.*))'
+)
+_DATE_RE = re.compile(r'^\d{1,2}/\d{1,2}/\d{2,4}')
+_PAGE_RE = re.compile(r'\b(\d{1,2})/\d{1,2}\b')
+_PAGE_TAIL_RE = re.compile(r'(.*?)\b(\d{1,2}/\d{1,2})\b\s*$')
+# Title+URL+page-number noise: an episode title and an "N/M" anywhere in the line
+_NOISE_RE = re.compile(r'(?=.*The One (?:Where|with)).*\d+/\d+')
+_URL_RE = re.compile(r'https?://\S+')
+_WS_RE = re.compile(r'\s+')
+
+# Filename patterns like "S1_Ep1.pdf"
+_SEASON_RE = re.compile(r'[Ss](\d+)')
+_EPISODE_RE = re.compile(r'[Ee]p?(\d+)')
+
+# Credit patterns, paired with the metadata field they fill
+_WRITER_RES = [
+    (re.compile(r'Written by:?\s*(.+?)(?:\n|Transcribed|$)', re.IGNORECASE), "writers"),
+    (re.compile(r'Writer:?\s*(.+?)(?:\n|Transcribed|$)', re.IGNORECASE), "writers"),
+    (re.compile(r'Teleplay by:?\s*(.+?)(?:\n|Transcribed|$)', re.IGNORECASE), "teleplay_by"),
+    (re.compile(r'Story by:?\s*(.+?)(?:\n|Transcribed|$)', re.IGNORECASE), "story_by")
+]
+_TRANSCRIBED_WRITER_RE = re.compile(
+    r'^([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*(?:\s*&\s*[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)*)\s+Transcribed by:'
+)
+_DIRECTOR_RES = [
+    re.compile(r'Directed by:?\s*(.+?)(?:\n|$)', re.IGNORECASE),
+    re.compile(r'Director:?\s*(.+?)(?:\n|$)', re.IGNORECASE)
+]
+_PRODUCTION_CODE_RE = re.compile(r'Production Code:?\s*([A-Z0-9\-]+)', re.IGNORECASE)
+
 
 def extract_text_from_pdf(pdf_path):
-    doc = fitz.open(pdf_path)
-    text = ""
-    for page in doc:
-        text += page.get_text()
+    # Pages are read serially: PyMuPDF is not thread-safe, so parallelism
+    # happens per file rather than per page
+    parts = []
+    with fitz.open(pdf_path) as doc:
+        for page in doc:
+            parts.append(page.get_text("text"))
     # Remove non-breaking space
-    return text.replace('\u00a0', ' ')
+    return "".join(parts).replace('\u00a0', ' ')
 
 
-def extract_episode_metadata(text, pdf_path):
+def extract_episode_metadata(text, pdf_path, lines=None):
     """Extract detailed episode information and metadata"""
-    lines = text.splitlines()
+    if lines is None:
+        lines = text.splitlines()
     metadata = {
         "episode_title": None,
         "season": None,
@@ -33,45 +80,26 @@ def extract_episode_metadata(text, pdf_path):
             "filename": os.path.basename(pdf_path),
             "file_path": pdf_path,
             "file_size": None,
+            "modified_date": None,
             "extraction_date": datetime.now().isoformat()
         }
     }
     
-    # Get file size
+    # Get file size and modification time from a single stat call
     try:
-        metadata["file_info"]["file_size"] = os.path.getsize(pdf_path)
-    except:
+        file_stat = os.stat(pdf_path)
+    except OSError:
         pass
-    
-    # Extract episode title - look for the full title which might span multiple lines
-    for i, line in enumerate(lines[:50]):
-        clean_line = line.strip()
-        if clean_line.lower().startswith("the one"):
-            # Check if this is a complete title or if we need to combine with next lines
-            title = clean_line
-            
-            # If the line ends with "(" or seems incomplete, check next lines
-            if (title.endswith("(") or title.count("(") > title.count(")")) and i + 1 < len(lines):
-                next_line = lines[i + 1].strip()
-                # Combine lines if the next line seems to be continuation
-                if next_line and not next_line.startswith("[") and not next_line.startswith("Written"):
-                    title = title + " " + next_line
-                    
-                    # Check one more line if still unbalanced parentheses
-                    if title.count("(") > title.count(")") and i + 2 < len(lines):
-                        third_line = lines[i + 2].strip()
-                        if third_line and not third_line.startswith("[") and not third_line.startswith("Written"):
-                            title = title + " " + third_line
-            
-            metadata["episode_title"] = title
-            break
+    else:
+        metadata["file_info"]["file_size"] = file_stat.st_size
+        metadata["file_info"]["modified_date"] = datetime.fromtimestamp(file_stat.st_mtime).isoformat()
     
     # Extract season and episode info from filename or content
     filename = os.path.basename(pdf_path)
     
     # Try to extract from filename patterns like "S1_Scripts/Friends_Ep1.pdf"
-    season_match = re.search(r'[Ss](\d+)', filename)
-    episode_match = re.search(r'[Ee]p?(\d+)', filename)
+    season_match = _SEASON_RE.search(filename)
+    episode_match = _EPISODE_RE.search(filename)
     
     if season_match:
         metadata["season"] = int(season_match.group(1))
@@ -86,77 +114,82 @@ def extract_episode_metadata(text, pdf_path):
             series_num = sum(season_episodes[1:metadata["season"]]) + metadata["episode_number"]
             metadata["series_episode_number"] = series_num
     
-    # Search for writing/directing credits in the text (only first 10 lines to avoid dialogue)
-    first_lines = lines[:10]  # Only search the very beginning
-    
-    # Look for writer credits - Friends scripts have unique formatting
-    writer_patterns = [
-        r'Written by:?\s*(.+?)(?:\n|Transcribed|$)',
-        r'Writer:?\s*(.+?)(?:\n|Transcribed|$)',
-        r'Teleplay by:?\s*(.+?)(?:\n|Transcribed|$)',
-        r'Story by:?\s*(.+?)(?:\n|Transcribed|$)'
-    ]
-    
-    # Standard patterns first
-    for pattern in writer_patterns:
-        for line in first_lines:
-            match = re.search(pattern, line, re.IGNORECASE)
+    # Scan the head of the script once, stripping each line a single time.
+    # Episode title - look for the full title which might span multiple lines.
+    # Credits only come from the first 10 lines to avoid dialogue; matches are
+    # bucketed per pattern so fields fill in pattern order.
+    head = [line.strip() for line in lines[:50]]
+    writer_matches = [[] for _ in _WRITER_RES]
+    director_matches = [[] for _ in _DIRECTOR_RES]
+    transcribed_writers = None
+    
+    for i, clean_line in enumerate(head):
+        if metadata["episode_title"] is None and clean_line.lower().startswith("the one"):
+            # Check if this is a complete title or if we need to combine with next lines
+            title = clean_line
+            
+            # If the line ends with "(" or seems incomplete, check next lines
+            if (title.endswith("(") or title.count("(") > title.count(")")) and i + 1 < len(lines):
+                next_line = lines[i + 1].strip()
+                # Combine lines if the next line seems to be continuation
+                if next_line and not next_line.startswith("[") and not next_line.startswith("Written"):
+                    title = title + " " + next_line
+                    
+                    # Check one more line if still unbalanced parentheses
+                    if title.count("(") > title.count(")") and i + 2 < len(lines):
+                        third_line = lines[i + 2].strip()
+                        if third_line and not third_line.startswith("[") and not third_line.startswith("Written"):
+                            title = title + " " + third_line
+            
+            metadata["episode_title"] = title
+        
+        if i >= 10:
+            if metadata["episode_title"] is not None:
+                break
+            continue
+        
+        # Look for writer credits - Friends scripts have unique formatting
+        for bucket, (pattern, _) in zip(writer_matches, _WRITER_RES):
+            match = pattern.search(clean_line)
             if match:
                 writer_text = match.group(1).strip()
-                writers = [w.strip() for w in writer_text.split('&') if w.strip()]
-                
-                if 'teleplay' in pattern.lower():
-                    metadata["teleplay_by"].extend(writers)
-                elif 'story' in pattern.lower():
-                    metadata["story_by"].extend(writers)
-                else:
-                    metadata["writers"].extend(writers)
-    
-    # Friends-specific pattern: Look for "Name Name Transcribed by:" at the very start
-    if not metadata["writers"]:  # Only if we haven't found writers yet
-        for i, line in enumerate(first_lines):
-            line = line.strip()
-            # Must be at the very beginning (first few lines) and followed by "Transcribed by:"
-            if i < 3 and re.match(r'^([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*(?:\s*&\s*[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)*)\s+Transcribed by:', line):
-                match = re.match(r'^([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*(?:\s*&\s*[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)*)\s+Transcribed by:', line)
-                if match:
-                    writer_text = match.group(1).strip()
-                    writers = [w.strip() for w in writer_text.split('&') if w.strip()]
-                    metadata["writers"].extend(writers)
-                    break
-    
-    # Look for director credits (also only in first 10 lines)
-    director_patterns = [
-        r'Directed by:?\s*(.+?)(?:\n|$)',
-        r'Director:?\s*(.+?)(?:\n|$)'
-    ]
-    
-    for pattern in director_patterns:
-        for line in first_lines:
-            match = re.search(pattern, line, re.IGNORECASE)
+                bucket.extend(w.strip() for w in writer_text.split('&') if w.strip())
+        
+        # Friends-specific pattern: "Name Name Transcribed by:" at the very start
+        if i < 3 and transcribed_writers is None:
+            match = _TRANSCRIBED_WRITER_RE.match(clean_line)
+            if match:
+                writer_text = match.group(1).strip()
+                transcribed_writers = [w.strip() for w in writer_text.split('&') if w.strip()]
+        
+        # Look for director credits
+        for bucket, pattern in zip(director_matches, _DIRECTOR_RES):
+            match = pattern.search(clean_line)
             if match:
                 director_text = match.group(1).strip()
-                directors = [d.strip() for d in director_text.split('&') if d.strip()]
-                metadata["directors"].extend(directors)
-    
-    # Look for production code (search in first 10 lines)
-    for line in first_lines:
-        prod_code_match = re.search(r'Production Code:?\s*([A-Z0-9\-]+)', line, re.IGNORECASE)
-        if prod_code_match:
-            metadata["production_code"] = prod_code_match.group(1)
-            break
-    
-    # Count total pages
-    page_numbers = set()
-    for line in lines:
-        page_match = re.search(r'\b(\d{1,2}/\d{1,2})\b', line)
-        if page_match:
-            page_numbers.add(page_match.group(1))
+                bucket.extend(d.strip() for d in director_text.split('&') if d.strip())
+        
+        # Look for production code
+        if metadata["production_code"] is None:
+            prod_code_match = _PRODUCTION_CODE_RE.search(clean_line)
+            if prod_code_match:
+                metadata["production_code"] = prod_code_match.group(1)
+    
+    # Standard writer patterns first
+    for bucket, (_, field) in zip(writer_matches, _WRITER_RES):
+        metadata[field].extend(bucket)
+    # Fall back to the "Transcribed by:" credit only if we haven't found writers yet
+    if not metadata["writers"] and transcribed_writers:
+        metadata["writers"].extend(transcribed_writers)
+    for bucket in director_matches:
+        metadata["directors"].extend(bucket)
+    
+    # Count total pages, scanning the whole text in one regex pass
+    page_numbers = {int(m.group(1)) for m in _PAGE_RE.finditer(text)}
     
     if page_numbers:
         # Get the highest page number
-        max_page = max([int(p.split('/')[0]) for p in page_numbers])
-        metadata["total_pages"] = max_page
+        metadata["total_pages"] = max(page_numbers)
     
     return metadata
 
@@ -170,88 +203,117 @@ def extract_episode_title(text):
     return None
 
 
-def calculate_script_statistics(script_data):
-    """Calculate detailed statistics about the script"""
-    stats = {
-        "total_scenes": len(script_data),
-        "total_dialogue_lines": 0,
-        "character_stats": {},
+def _start_statistics():
+    """Running totals for the script statistics, fed one finished scene at a time"""
+    return {
         "scene_lengths": [],
-        "average_scene_length": 0,
+        "total_dialogue_lines": 0,
         "longest_scene": None,
         "shortest_scene": None,
+        "pages": set(),
+        "scenes_appeared": Counter(),
+        "line_counts": Counter(),
+        "dialogue_lines_cleaned": 0
+    }
+
+
+def _add_scene_statistics(running, scene, scene_line_counts, scene_lines_cleaned=0):
+    """
+    Fold a finished scene, its per-speaker line counts and its number of
+    title-cleaned lines into the running totals
+    """
+    scene_index = len(running["scene_lengths"])
+    scene_length = len(scene["dialogue"])
+    running["scene_lengths"].append(scene_length)
+    running["total_dialogue_lines"] += scene_length
+    
+    # Keep the first index of the longest and shortest scene
+    if running["longest_scene"] is None or scene_length > running["longest_scene"]["length"]:
+        running["longest_scene"] = {"length": scene_length, "scene_index": scene_index}
+    if running["shortest_scene"] is None or scene_length < running["shortest_scene"]["length"]:
+        running["shortest_scene"] = {"length": scene_length, "scene_index": scene_index}
+    
+    # Track pages and characters
+    if scene.get("page_numbers"):
+        running["pages"].update(scene["page_numbers"])
+    running["scenes_appeared"].update(scene["characters"])
+    running["line_counts"].update(scene_line_counts)
+    running["dialogue_lines_cleaned"] += scene_lines_cleaned
+
+
+def _finish_statistics(running):
+    """Turn the running totals into the statistics dict"""
+    scene_lengths = running["scene_lengths"]
+    scenes_appeared = running["scenes_appeared"]
+    line_counts = running["line_counts"]
+    stats = {
+        "total_scenes": len(scene_lengths),
+        "total_dialogue_lines": running["total_dialogue_lines"],
+        "character_stats": {},
+        "scene_lengths": scene_lengths,
+        "average_scene_length": 0,
+        "longest_scene": running["longest_scene"],
+        "shortest_scene": running["shortest_scene"],
         "page_range": None,
-        "unique_characters": set(),
-        "speaking_characters": set()
+        "unique_characters": list(scenes_appeared),
+        "speaking_characters": list(line_counts)
     }
     
-    all_pages = set()
+    if scene_lengths:
+        stats["average_scene_length"] = stats["total_dialogue_lines"] / len(scene_lengths)
     
-    for scene in script_data:
-        scene_length = len(scene["dialogue"])
-        stats["scene_lengths"].append(scene_length)
-        stats["total_dialogue_lines"] += scene_length
-        
-        # Track pages
-        if scene.get("page_numbers"):
-            all_pages.update(scene["page_numbers"])
-        
-        # Track characters
-        for char in scene["characters"]:
-            stats["unique_characters"].add(char)
-            if char not in stats["character_stats"]:
-                stats["character_stats"][char] = {
-                    "total_lines": 0,
-                    "scenes_appeared": 0,
-                    "average_lines_per_scene": 0
-                }
-            stats["character_stats"][char]["scenes_appeared"] += 1
-        
-        # Count lines per character in this scene
-        for dialogue in scene["dialogue"]:
-            speaker = dialogue["speaker"]
-            stats["speaking_characters"].add(speaker)
-            if speaker in stats["character_stats"]:
-                stats["character_stats"][speaker]["total_lines"] += 1
-    
-    # Calculate averages and extremes
-    if stats["scene_lengths"]:
-        stats["average_scene_length"] = sum(stats["scene_lengths"]) / len(stats["scene_lengths"])
-        
-        max_length = max(stats["scene_lengths"])
-        min_length = min(stats["scene_lengths"])
-        
-        stats["longest_scene"] = {
-            "length": max_length,
-            "scene_index": stats["scene_lengths"].index(max_length)
+    # Calculate character totals and averages
+    for char, appeared in scenes_appeared.items():
+        stats["character_stats"][char] = {
+            "total_lines": line_counts[char],
+            "scenes_appeared": appeared,
+            "average_lines_per_scene": line_counts[char] / appeared
         }
-        stats["shortest_scene"] = {
-            "length": min_length,
-            "scene_index": stats["scene_lengths"].index(min_length)
-        }
-    
-    # Calculate character averages
-    for char, char_stats in stats["character_stats"].items():
-        if char_stats["scenes_appeared"] > 0:
-            char_stats["average_lines_per_scene"] = char_stats["total_lines"] / char_stats["scenes_appeared"]
     
     # Page range
-    if all_pages:
-        page_nums = [int(p.split('/')[0]) for p in all_pages]
+    if running["pages"]:
+        page_nums = [int(p.split('/')[0]) for p in running["pages"]]
         stats["page_range"] = {"start": min(page_nums), "end": max(page_nums)}
     
-    # Convert sets to lists for JSON serialization
-    stats["unique_characters"] = list(stats["unique_characters"])
-    stats["speaking_characters"] = list(stats["speaking_characters"])
-    
     return stats
 
 
-def clean_line_and_extract_page(text, episode_title=None):
+def calculate_script_statistics(script_data):
+    """Calculate detailed statistics about the script"""
+    running = _start_statistics()
+    for scene in script_data:
+        scene_line_counts = Counter(dialogue["speaker"] for dialogue in scene["dialogue"])
+        _add_scene_statistics(running, scene, scene_line_counts)
+    return _finish_statistics(running)
+
+
+def build_title_patterns(episode_title=None):
+    """
+    Compile the per-script patterns used to clean dialogue lines: one strips a
+    trailing episode title and any URLs, the other removes the title wherever
+    it appears accidentally (with flexible spacing)
+    """
+    if not episode_title:
+        return _URL_RE, None
+    escaped_title = re.escape(episode_title)
+    strip_pattern = re.compile(rf'(?i:\s*{escaped_title}\s*$)|https?://\S+')
+    # Make spaces flexible and handle common variations
+    flexible_title = escaped_title.replace(r'\ ', r'\s+')
+    title_pattern = re.compile(rf'\s*{flexible_title}\s*', re.IGNORECASE)
+    return strip_pattern, title_pattern
+
+
+def clean_line_and_extract_page(text, strip_pattern=_URL_RE, title_pattern=None):
+    """
+    Return the cleaned dialogue line, its trailing page number (or None) and
+    whether the episode title had to be removed from inside the line
+    """
     original = text.strip()
 
-    # Match and extract trailing page number
-    match = re.search(r'(.*?)\b(\d{1,2}/\d{1,2})\b\s*$', original)
+    # Match and extract trailing page number. Anchored at the start: the lazy
+    # prefix already covers every offset, so search() would only retry the
+    # same failure from each position (quadratic on lines without a page)
+    match = _PAGE_TAIL_RE.match(original)
     if match:
         raw_before = match.group(1).strip()
         page_number = match.group(2).strip()
@@ -259,147 +321,134 @@ def clean_line_and_extract_page(text, episode_title=None):
         raw_before = original
         page_number = None
 
-    # Remove episode title if it's at the end of the line
-    if episode_title:
-        raw_before = re.sub(
-            rf'\s*{re.escape(episode_title)}\s*$', '', raw_before, flags=re.IGNORECASE
-        )
+    # Remove episode title if it's at the end of the line, and any URLs
+    raw_before = strip_pattern.sub('', raw_before).strip()
 
-    # Remove trailing URLs
-    raw_before = re.sub(r'https?://\S+', '', raw_before).strip()
+    if title_pattern is None:
+        return raw_before, page_number, False
 
-    return raw_before, page_number
+    # Remove the episode title wherever else it shows up, then clean up any extra whitespace
+    cleaned_line = _WS_RE.sub(' ', title_pattern.sub('', raw_before)).strip()
+    return cleaned_line, page_number, cleaned_line != raw_before
 
 
-def clean_episode_title_from_dialogue(script_data, episode_title):
+def parse_friends_script(raw_text, metadata, lines=None, return_statistics=False):
     """
-    Remove episode title from dialogue lines where it appears accidentally
+    Split script text into scenes with dialogue and stage directions. With
+    return_statistics, also return the calculate_script_statistics result and
+    the number of dialogue lines the episode title was removed from, both
+    built while parsing instead of in a second pass
     """
-    if not episode_title:
-        return script_data, 0
-    
-    # Create a regex pattern that matches the episode title (case insensitive)
-    # Also handle slight variations in spacing and punctuation
-    title_pattern = re.escape(episode_title)
-    # Make spaces flexible and handle common variations
-    title_pattern = title_pattern.replace(r'\ ', r'\s+')
-    title_pattern = rf'\s*{title_pattern}\s*'
-    
-    cleaned_count = 0
-    
-    for scene in script_data:
-        for dialogue_entry in scene["dialogue"]:
-            original_line = dialogue_entry["line"]
-            
-            # Remove the episode title if found
-            cleaned_line = re.sub(title_pattern, '', original_line, flags=re.IGNORECASE)
-            
-            # Clean up any extra whitespace
-            cleaned_line = re.sub(r'\s+', ' ', cleaned_line).strip()
-            
-            # Only update if something was actually removed
-            if cleaned_line != original_line:
-                dialogue_entry["line"] = cleaned_line
-                cleaned_count += 1
-                
-                # Mark that this line was cleaned (for debugging/tracking)
-                dialogue_entry["cleaned"] = True
-    
-    return script_data, cleaned_count
-
-
-def parse_friends_script(raw_text, metadata):
+    episode_title = metadata.get("episode_title")
     script_data = []
+    running = _start_statistics()
     current_scene = {
         "scene": None,
         "scene_number": 0,
-        "characters": set(),
+        "characters": {},  # Insertion-ordered set
         "dialogue": [],
-        "page_numbers": set(),
-        "episode_title": metadata.get("episode_title"),
+        "page_numbers": {},
+        "episode_title": episode_title,
         "stage_directions": []  # NEW: Track stage directions
     }
+    # Containers of the current scene, re-bound whenever a new scene starts
+    scene_characters = current_scene["characters"]
+    scene_pages = current_scene["page_numbers"]
+    dialogue_append = current_scene["dialogue"].append
+    directions_append = current_scene["stage_directions"].append
+    scene_line_counts = Counter()
+    scene_lines_cleaned = 0
     current_speaker = None
     buffer = ""
     scene_counter = 0
+    strip_pattern, title_pattern = build_title_patterns(episode_title)
+
+    if lines is None:
+        lines = raw_text.splitlines()
+
+    # Drop throwaway lines up front, keeping 1-based line numbers: blank lines
+    # (skipped before paying for a strip() copy), lines starting with a date
+    # like "7/5/25, 8:20 AM", and title+URL+page-number noise lines ("http" is
+    # the cheap, rare check)
+    script_lines = [
+        (line_num, line)
+        for line_num, raw_line in enumerate(lines, 1)
+        if raw_line and not raw_line.isspace()
+        for line in (raw_line.strip(),)
+        if not _DATE_RE.match(line) and not ("http" in line and _NOISE_RE.match(line))
+    ]
 
-    lines = raw_text.splitlines()
-
-    for line_num, line in enumerate(lines):
-        line = line.strip()
-
-        if not line:
-            continue
-
-        # Skip title+URL+page-number noise lines
-        if (
-            ("The One Where" in line or "The One with" in line)
-            and "http" in line
-            and re.search(r"\d+/\d+", line)
-        ):
-            continue
-
-        # Skip lines starting with a date like "7/5/25, 8:20 AM"
-        if re.match(r'^\d{1,2}/\d{1,2}/\d{2,4}', line):
-            continue
+    for line_num, line in script_lines:
+        line_match = _LINE_RE.match(line)
+        kind = line_match.lastgroup if line_match else None
 
         # Scene heading
-        if line.startswith("[Scene:"):
+        if kind == "scene":
             if current_scene["dialogue"] or current_scene["stage_directions"]:
                 current_scene["characters"] = list(current_scene["characters"])
                 current_scene["page_numbers"] = list(current_scene["page_numbers"])
                 script_data.append(current_scene)
+                _add_scene_statistics(running, current_scene, scene_line_counts, scene_lines_cleaned)
 
             scene_counter += 1
-            scene_match = re.search(r"\[Scene:\s*(.*?)\]", line)
             current_scene = {
-                "scene": scene_match.group(1) if scene_match else None,
+                "scene": line_match.group("scene_name"),
                 "scene_number": scene_counter,
-                "characters": set(),
+                "characters": {},
                 "dialogue": [],
-                "page_numbers": set(),
-                "episode_title": metadata.get("episode_title"),
+                "page_numbers": {},
+                "episode_title": episode_title,
                 "stage_directions": [],
-                "line_number_start": line_num + 1
+                "line_number_start": line_num
             }
+            scene_characters = current_scene["characters"]
+            scene_pages = current_scene["page_numbers"]
+            dialogue_append = current_scene["dialogue"].append
+            directions_append = current_scene["stage_directions"].append
+            scene_line_counts = Counter()
+            scene_lines_cleaned = 0
             current_speaker = None
             buffer = ""
             continue
 
         # Capture stage directions
-        if line.startswith("[") or line.startswith("("):
-            current_scene["stage_directions"].append({
+        if kind == "stage":
+            directions_append({
                 "direction": line,
-                "line_number": line_num + 1
+                "line_number": line_num
             })
             continue
 
         # Speaker line
-        match = re.match(r"^([A-Z][a-z]+):\s*(.*)", line)
-        if match:
+        if kind == "speaker":
             # Save previous buffered line
             if current_speaker and buffer:
-                cleaned, page_number = clean_line_and_extract_page(buffer.strip(), episode_title=metadata.get("episode_title"))
+                cleaned, page_number, title_removed = clean_line_and_extract_page(buffer.strip(), strip_pattern, title_pattern)
                 entry = {
                     "speaker": current_speaker, 
                     "line": cleaned,
-                    "line_number": line_num + 1
+                    "line_number": line_num
                 }
                 if page_number:
                     entry["page_number"] = page_number
-                    current_scene["page_numbers"].add(page_number)
-                current_scene["dialogue"].append(entry)
-
-            current_speaker = match.group(1)
-            buffer = match.group(2)
-            current_scene["characters"].add(current_speaker)
+                    scene_pages[page_number] = None
+                if title_removed:
+                    # Mark that this line was cleaned (for debugging/tracking)
+                    entry["cleaned"] = True
+                    scene_lines_cleaned += 1
+                dialogue_append(entry)
+                scene_line_counts[current_speaker] += 1
+
+            current_speaker = line_match.group("name")
+            buffer = line_match.group("say")
+            scene_characters[current_speaker] = None
         else:
             if current_speaker:
                 buffer += " " + line
 
     # Final dialogue flush
     if current_speaker and buffer:
-        cleaned, page_number = clean_line_and_extract_page(buffer.strip(), episode_title=metadata.get("episode_title"))
+        cleaned, page_number, title_removed = clean_line_and_extract_page(buffer.strip(), strip_pattern, title_pattern)
         entry = {
             "speaker": current_speaker, 
             "line": cleaned,
@@ -407,12 +456,19 @@ def parse_friends_script(raw_text, metadata):
         }
         if page_number:
             entry["page_number"] = page_number
-            current_scene["page_numbers"].add(page_number)
-        current_scene["dialogue"].append(entry)
+            scene_pages[page_number] = None
+        if title_removed:
+            entry["cleaned"] = True
+            scene_lines_cleaned += 1
+        dialogue_append(entry)
+        scene_line_counts[current_speaker] += 1
         current_scene["characters"] = list(current_scene["characters"])
         current_scene["page_numbers"] = list(current_scene["page_numbers"])
         script_data.append(current_scene)
+        _add_scene_statistics(running, current_scene, scene_line_counts, scene_lines_cleaned)
 
+    if return_statistics:
+        return script_data, _finish_statistics(running), running["dialogue_lines_cleaned"]
     return script_data
 
 
@@ -422,23 +478,19 @@ def parse_friends_script_with_metadata(pdf_path, output_path=None):
     """
     # Extract text
     text = extract_text_from_pdf(pdf_path)
+    lines = text.splitlines()
     
     # Extract metadata
-    metadata = extract_episode_metadata(text, pdf_path)
+    metadata = extract_episode_metadata(text, pdf_path, lines=lines)
     
-    # Parse script
-    script_data = parse_friends_script(text, metadata)
-    
-    # Clean episode title from dialogue lines
-    script_data, cleaned_count = clean_episode_title_from_dialogue(script_data, metadata.get("episode_title"))
-    
-    # Calculate statistics
-    statistics = calculate_script_statistics(script_data)
+    # Parse script, calculating statistics and stripping episode titles from
+    # dialogue lines along the way
+    script_data, statistics, cleaned_count = parse_friends_script(text, metadata, lines=lines, return_statistics=True)
     
     # Add cleaning info to parsing metadata
     parsing_info = {
         "parser_version": "2.0",
-        "total_lines_processed": len(text.splitlines()),
+        "total_lines_processed": len(lines),
         "parsing_date": datetime.now().isoformat(),
         "dialogue_lines_cleaned": cleaned_count
     }
@@ -453,22 +505,70 @@ def parse_friends_script_with_metadata(pdf_path, output_path=None):
     
     # Save to file if output path provided
     if output_path:
-        with open(output_path, "w", encoding='utf-8') as f:
-            json.dump(full_data, f, indent=2, ensure_ascii=False)
+        if orjson is not None:
+            # Same bytes as json.dump(indent=2, ensure_ascii=False) below
+            with open(output_path, "wb") as f:
+                f.write(orjson.dumps(full_data, option=orjson.OPT_INDENT_2))
+        else:
+            with open(output_path, "w", encoding='utf-8') as f:
+                json.dump(full_data, f, indent=2, ensure_ascii=False)
         print(f"✅ Enhanced script data saved to: {output_path}")
     
     # Return the full_data instead of None
     return full_data
 
 
-if __name__ == "__main__":
-    pdf_path = "Raw_Data/S1_Scripts/S1_Ep6.pdf"
-    output_path = "Parsed_Scripts/parsed_s1_e6.json"
+def default_output_path(pdf_path, out_dir):
+    """Build an output path like "parsed_s1_e6.json" from a script filename"""
+    filename = os.path.basename(pdf_path)
+    season_match = _SEASON_RE.search(filename)
+    episode_match = _EPISODE_RE.search(filename)
+    if season_match and episode_match:
+        name = f"parsed_s{int(season_match.group(1))}_e{int(episode_match.group(1))}.json"
+    else:
+        name = f"parsed_{os.path.splitext(filename)[0].lower()}.json"
+    return os.path.join(out_dir, name)
+
+
+def _parse_to_dir(args):
+    # Module-level so it can be pickled for worker processes
+    pdf_path, out_dir = args
+    output_path = default_output_path(pdf_path, out_dir) if out_dir else None
+    return parse_friends_script_with_metadata(pdf_path, output_path)
+
+
+def parse_many(pdf_paths, out_dir=None, workers=None):
+    """
+    Parse several script PDFs in parallel worker processes, returning the
+    results in the same order as pdf_paths
+    """
+    if workers is not None and workers < 1:
+        raise ValueError(f"workers must be at least 1, got {workers}")
+    pdf_paths = list(pdf_paths)
+    if out_dir:
+        os.makedirs(out_dir, exist_ok=True)
+    jobs = [(pdf_path, out_dir) for pdf_path in pdf_paths]
     
-    # Parse with full metadata
-    result = parse_friends_script_with_metadata(pdf_path, output_path)
+    # Not worth spinning up processes for a single script
+    if workers == 1 or len(jobs) <= 1:
+        return [_parse_to_dir(job) for job in jobs]
     
-    # Print summary
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(_parse_to_dir, jobs))
+
+
+def _worker_count(value):
+    # argparse type for --workers: reports bad values through parser.error
+    try:
+        workers = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected an integer, got {value!r}")
+    if workers < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {workers}")
+    return workers
+
+
+def print_summary(result):
     print(f"📺 Episode: {result['metadata']['episode_title']}")
     print(f"🎬 Season {result['metadata']['season']}, Episode {result['metadata']['episode_number']}")
     print(f"📄 Total Pages: {result['metadata']['total_pages']}")
@@ -479,4 +579,21 @@ if __name__ == "__main__":
     if result['metadata']['writers']:
         print(f"✍️ Writers: {', '.join(result['metadata']['writers'])}")
     if result['metadata']['directors']:
-        print(f"🎬 Directors: {', '.join(result['metadata']['directors'])}")
\ No newline at end of file
+        print(f"🎬 Directors: {', '.join(result['metadata']['directors'])}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Parse Friends script PDFs into JSON")
+    parser.add_argument("pdf_paths", nargs="*", help="script PDFs to parse (default: Raw_Data/S1_Scripts/S1_Ep6.pdf)")
+    parser.add_argument("-o", "--out-dir", default="Parsed_Scripts", help="directory for the parsed JSON files")
+    parser.add_argument("-j", "--workers", type=_worker_count, default=None, help="number of worker processes (default: CPU count)")
+    args = parser.parse_args()
+    
+    pdf_paths = args.pdf_paths or ["Raw_Data/S1_Scripts/S1_Ep6.pdf"]
+    
+    # Parse with full metadata
+    results = parse_many(pdf_paths, args.out_dir, workers=args.workers)
+    
+    # Print summary
+    for result in results:
+        print_summary(result)